@@ -1,18 +1,39 @@
 import json
+import os
+import functools
+from collections import namedtuple
+from dataclasses import dataclass, field
+from typing import List, Optional
+from operator import itemgetter
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
-from datetime import datetime, timezone
-import pytz
-from multiprocessing import Queue
+from datetime import datetime
+import queue
+import threading
 import pygame
+import pygame.freetype
 import time
 
+# Timezone resolved once at import (MBTA is in Boston)
+try:
+    from zoneinfo import ZoneInfo
+    _EASTERN = ZoneInfo('America/New_York')
+except (ImportError, KeyError):  # Python < 3.9 or no system tz database
+    import pytz
+    _EASTERN = pytz.timezone('US/Eastern')
+
 # Initialize Pygame
 pygame.init()
+pygame.freetype.init()
 
 # Constants for display
 SCREEN_WIDTH = 720
 SCREEN_HEIGHT = 720
+COL_ROUTE_X, COL_TIME_X, COL_COUNTDOWN_X = 100, 300, 500  # Column x-coordinates
+FETCH_INTERVAL = 60  # Seconds between API polls
 BACKGROUND_COLOR = (0, 0, 0)  # Black
 TEXT_COLOR = (255, 255, 0)  # Yellow
 HEADER_COLOR = (255, 255, 255)  # White
@@ -20,11 +41,29 @@ ARRIVAL_COLOR = (0, 255, 0)  # Green
 WARNING_COLOR = (255, 165, 0)  # Orange
 URGENT_COLOR = (255, 0, 0)  # Red
 
-# Fonts
-header_font = pygame.font.Font(None, 46)
-route_font = pygame.font.Font(None, 38)
-time_font = pygame.font.Font(None, 32)
-small_font = pygame.font.Font(None, 28)
+# Fonts (freetype sizes are the old pygame.font sizes scaled by its 0.6875 default-font factor)
+header_font = pygame.freetype.Font(None, 31)
+route_font = pygame.freetype.Font(None, 26)
+time_font = pygame.freetype.Font(None, 22)
+small_font = pygame.freetype.Font(None, 19)
+_FONTS = {'header': header_font, 'route': route_font, 'time': time_font, 'small': small_font}
+for _font in _FONTS.values():
+    _font.pad = True  # Full line-height surfaces, so text in a row shares a baseline
+
+
+@functools.lru_cache(maxsize=512)
+def _render(text, font_key, color):
+    """Render text once and reuse the surface on later frames"""
+    return _FONTS[font_key].render(text, color)[0]
+
+
+# Shared HTTP session so Keep-Alive reuses the TCP/TLS connection across polls
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=1, pool_maxsize=4,
+                       max_retries=Retry(total=2, backoff_factor=0.3,
+                                         status_forcelist=[502, 503, 504]))
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
 
 
 class BusArrivalDisplay:
@@ -33,6 +72,13 @@ class BusArrivalDisplay:
         pygame.display.set_caption("Live Bus Arrivals")
         self.clock = pygame.time.Clock()
         self.running = True
+        self._last_hash = None  # State of the last frame actually drawn
+        self._last_fetched = None  # Epoch seconds of the last successful fetch
+
+        # Pre-warm the surfaces drawn on every frame
+        _render("Live Bus Arrivals", 'header', HEADER_COLOR)
+        for label in ("Route", "Arrival", "Countdown"):
+            _render(label, 'route', HEADER_COLOR)
 
     def get_arrival_color(self, minutes_to_arrival):
         """Get color based on arrival time"""
@@ -46,23 +92,23 @@ class BusArrivalDisplay:
             return ARRIVAL_COLOR
 
 
-    def draw_header(self, stop_name):
+    def draw_header(self, stop_name, updated_time):
         """Draw the header section"""
         # Main title
-        title_text = header_font.render("Live Bus Arrivals", True, HEADER_COLOR)
+        title_text = _render("Live Bus Arrivals", 'header', HEADER_COLOR)
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, 30))
         self.screen.blit(title_text, title_rect)
 
         # Stop name
-        stop_text = route_font.render(f"{stop_name}", True, TEXT_COLOR)
+        stop_text = _render(f"{stop_name}", 'route', TEXT_COLOR)
         stop_rect = stop_text.get_rect(center=(SCREEN_WIDTH // 2, 65))
         self.screen.blit(stop_text, stop_rect)
 
-        # Current time
-        current_time = datetime.now().strftime('%I:%M:%S %p')
-        time_text = time_font.render(f"Updated: {current_time}", True, TEXT_COLOR)
-        time_rect = time_text.get_rect(center=(SCREEN_WIDTH // 2, 90))
-        self.screen.blit(time_text, time_rect)
+        # Time of the last successful fetch (drawn straight onto the screen)
+        time_label = f"Updated: {updated_time}"
+        time_rect = time_font.get_rect(time_label)
+        time_rect.center = (SCREEN_WIDTH // 2, 90)
+        time_font.render_to(self.screen, time_rect, time_label, TEXT_COLOR)
 
         # Separator line
         pygame.draw.line(self.screen, TEXT_COLOR, (50, 110), (SCREEN_WIDTH - 50, 110), 2)
@@ -71,42 +117,40 @@ class BusArrivalDisplay:
         """Draw column headers"""
         y_pos = 125
 
-        route_header = route_font.render("Route", True, HEADER_COLOR)
-        self.screen.blit(route_header, (100, y_pos))
+        route_header = _render("Route", 'route', HEADER_COLOR)
+        self.screen.blit(route_header, (COL_ROUTE_X, y_pos))
 
-        time_header = route_font.render("Arrival", True, HEADER_COLOR)
-        self.screen.blit(time_header, (300, y_pos))
+        time_header = _render("Arrival", 'route', HEADER_COLOR)
+        self.screen.blit(time_header, (COL_TIME_X, y_pos))
 
-        countdown_header = route_font.render("Countdown", True, HEADER_COLOR)
-        self.screen.blit(countdown_header, (500, y_pos))
+        countdown_header = _render("Countdown", 'route', HEADER_COLOR)
+        self.screen.blit(countdown_header, (COL_COUNTDOWN_X, y_pos))
 
         # Separator line
         pygame.draw.line(self.screen, TEXT_COLOR, (50, y_pos + 25), (SCREEN_WIDTH - 50, y_pos + 25), 1)
 
-    def draw_arrivals(self, arrivals):
+    def draw_arrivals(self, arrivals, minutes):
         """Draw the arrival information"""
         start_y = 160
         line_height = 40
         max_visible = 8  # Maximum arrivals to show on screen
 
-        visible_arrivals = arrivals[:max_visible]
+        visible_count = min(max_visible, len(arrivals))
 
-        for i, arrival in enumerate(visible_arrivals):
+        for i in range(visible_count):
             y_pos = start_y + (i * line_height)
 
-            route_name = arrival.get('route_short_name', 'Unknown')
-            route_type = arrival.get('route_type', 'Bus')
-            formatted_time = arrival.get('formatted_time', 'Unknown')
-            minutes_to_arrival = arrival.get('minutes_to_arrival')
-
+            route_name = arrivals.short_names[i]
+            formatted_time = arrivals.formatted_times[i]
+            minutes_to_arrival = minutes[i]
 
             # Route information
-            route_text = route_font.render(f"{route_name}", True, TEXT_COLOR)
-            self.screen.blit(route_text, (100, y_pos))
+            route_text = _render(f"{route_name}", 'route', TEXT_COLOR)
+            self.screen.blit(route_text, (COL_ROUTE_X, y_pos))
 
             # Arrival time
-            time_text = time_font.render(formatted_time, True, TEXT_COLOR)
-            self.screen.blit(time_text, (300, y_pos))
+            time_text = _render(formatted_time, 'time', TEXT_COLOR)
+            self.screen.blit(time_text, (COL_TIME_X, y_pos))
 
             # Countdown with appropriate color
             if minutes_to_arrival is not None:
@@ -126,25 +170,25 @@ class BusArrivalDisplay:
                 countdown_text = "Unknown"
                 color = TEXT_COLOR
 
-            countdown_surface = time_font.render(countdown_text, True, color)
-            self.screen.blit(countdown_surface, (500, y_pos))
+            countdown_surface = _render(countdown_text, 'time', color)
+            self.screen.blit(countdown_surface, (COL_COUNTDOWN_X, y_pos))
 
             # Draw separator line between routes
-            if i < len(visible_arrivals) - 1:
+            if i < visible_count - 1:
                 pygame.draw.line(self.screen, (64, 64, 64),
                                  (50, y_pos + line_height - 5),
                                  (SCREEN_WIDTH - 50, y_pos + line_height - 5), 1)
 
-    def draw_no_arrivals(self):
+    def draw_no_arrivals(self, updated_time):
         """Draw message when no arrivals available"""
-        no_data_text = route_font.render("🔭 No arrival information available", True, WARNING_COLOR)
+        no_data_text = _render("🔭 No arrival information available", 'route', WARNING_COLOR)
         no_data_rect = no_data_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
         self.screen.blit(no_data_text, no_data_rect)
 
-        current_time = datetime.now().strftime('%I:%M:%S %p')
-        time_text = time_font.render(f"📅 Last Updated: {current_time}", True, TEXT_COLOR)
-        time_rect = time_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 40))
-        self.screen.blit(time_text, time_rect)
+        time_label = f"📅 Last Updated: {updated_time}"
+        time_rect = time_font.get_rect(time_label)
+        time_rect.center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 40)
+        time_font.render_to(self.screen, time_rect, time_label, TEXT_COLOR)
 
     def display_arrivals(self, arrivals):
         """Main display function - replaces the console print version"""
@@ -157,21 +201,39 @@ class BusArrivalDisplay:
                 if event.key == pygame.K_ESCAPE:
                     self.running = False
                     return False
+            elif event.type == pygame.VIDEOEXPOSE:
+                self._last_hash = None  # Window contents were lost, force a redraw
+
+        stop_name = arrivals.stop_name
+        if arrivals.fetched_at is not None:
+            self._last_fetched = arrivals.fetched_at
+        if self._last_fetched is not None:
+            updated_time = datetime.fromtimestamp(self._last_fetched).strftime('%I:%M:%S %p')
+        else:
+            updated_time = "--"
+
+        # Countdown is recomputed every frame so it keeps ticking between fetches
+        minutes = arrivals.minutes_until(time.time())
+
+        # Skip the redraw entirely while nothing on screen would change
+        state_hash = hash((stop_name, updated_time, tuple(arrivals.short_names),
+                           tuple(arrivals.arrival_times), tuple(minutes)))
+        if state_hash == self._last_hash:
+            self.clock.tick(60)
+            return True
+        self._last_hash = state_hash
 
         # Clear screen
         self.screen.fill(BACKGROUND_COLOR)
 
         if arrivals:
-            # Get stop name from first arrival
-            stop_name = arrivals[0].get('stop_name', 'Unknown Stop')
-
             # Draw all components
-            self.draw_header(stop_name)
+            self.draw_header(stop_name, updated_time)
             self.draw_column_headers()
-            self.draw_arrivals(arrivals)
+            self.draw_arrivals(arrivals, minutes)
         else:
-            self.draw_header("Unknown Stop")
-            self.draw_no_arrivals()
+            self.draw_header(stop_name, updated_time)
+            self.draw_no_arrivals(updated_time)
 
         # Update display
         pygame.display.flip()
@@ -192,118 +254,174 @@ def input_thread(a_list):
     a_list.append(True)
 
 
-def safe_get_nested_value(data, *keys, default=None):
-    """Safely get nested dictionary values"""
-    for key in keys:
-        if isinstance(data, dict):
-            data = data.get(key, default)
-        else:
-            return default
-    return data
+def _get_endpoint(provider_config):
+    """Get the arrivals endpoint template from the provider config"""
+    return (provider_config.get('endpoints') or {}).get('arrivals')
+
+
+@functools.lru_cache(maxsize=4)
+def _read_config(config_path, mtime):
+    """Parse the config file; cached per (path, mtime) so edits are still picked up"""
+    with open(config_path, 'r') as file:
+        return json.load(file)
 
 
 def load_config(config_path="ProviderConfig.json"):
     """Load configuration with error handling"""
     try:
-        with open(config_path, 'r') as file:
-            config = json.load(file)
-        return config
+        return _read_config(config_path, os.path.getmtime(config_path))
     except (FileNotFoundError, json.JSONDecodeError) as e:
         logging.error(f"Failed to load config: {e}")
         return None
 
 
+# Last successful response, reused when the server answers 304 Not Modified
+_LAST_ETAG = None
+_LAST_DATA = None
+
+
 def make_api_request(url, headers=None, timeout=30):
     """Make API request with proper error handling"""
+    global _LAST_ETAG, _LAST_DATA
+
+    # Ask the server to skip the body if nothing changed since the last poll
+    if _LAST_ETAG and _LAST_DATA is not None:
+        headers = dict(headers or {}, **{'If-None-Match': _LAST_ETAG})
+
     try:
-        response = requests.get(url, headers=headers, timeout=timeout)
+        response = _SESSION.get(url, headers=headers, timeout=timeout)
         response.raise_for_status()  # Raises an HTTPError for bad responses
-        return response.json()
+        if response.status_code == 304:
+            return _LAST_DATA
+        data = orjson.loads(response.content)
     except requests.exceptions.RequestException as e:
         logging.error(f"API request failed: {e}")
         return None
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         logging.error(f"Failed to parse JSON response: {e}")
         return None
 
+    _LAST_ETAG = response.headers.get('ETag')
+    _LAST_DATA = data
+    return data
 
-def calculate_time_to_arrival(arrival_time_str):
-    """Calculate time to arrival in minutes"""
+
+def parse_arrival_time(arrival_time_str):
+    """Parse an ISO arrival time string into an aware datetime"""
     if not arrival_time_str:
         return None
 
     try:
-        # Parse the arrival time (ISO format)
-        arrival_time = datetime.fromisoformat(arrival_time_str.replace('Z', '+00:00'))
-
-        # Get current time in the same timezone
-        current_time = datetime.now(timezone.utc)
-
-        # Calculate difference in minutes
-        time_diff = arrival_time - current_time
-        minutes_to_arrival = int(time_diff.total_seconds() / 60)
-
-        return minutes_to_arrival if minutes_to_arrival > 0 else 0
+        if arrival_time_str.endswith('Z'):
+            arrival_time_str = arrival_time_str[:-1] + '+00:00'
+        return datetime.fromisoformat(arrival_time_str)
     except (ValueError, TypeError) as e:
         logging.warning(f"Could not parse arrival time {arrival_time_str}: {e}")
         return None
 
 
-def format_arrival_time(arrival_time_str):
-    """Format arrival time for display"""
-    if not arrival_time_str:
-        return "Unknown"
+# Route info used when a prediction's route is not in the included data
+_UNKNOWN_ROUTE = {"short_name": "Unknown", "long_name": "Unknown Route", "route_type": 0}
+# Route info used when there is no route id or no route data to look it up in;
+# it has no route_type, so callers fall back to their own default (Bus)
+_NO_ROUTE = {"short_name": "Unknown", "long_name": "Unknown Route"}
 
-    try:
-        # Parse the arrival time and convert to local time
-        arrival_time = datetime.fromisoformat(arrival_time_str.replace('Z', '+00:00'))
+# Sort key for raw prediction tuples, whose first field is the predicted time
+_ARRIVAL_KEY = itemgetter(0)
 
-        # Convert to Eastern Time (MBTA is in Boston)
-        eastern = pytz.timezone('US/Eastern')
-        local_time = arrival_time.astimezone(eastern)
 
-        return local_time.strftime('%I:%M %p')
-    except (ValueError, TypeError):
-        return arrival_time_str
-
-
-def extract_route_info(included_data, route_id):
-    """Extract route information from included data"""
-    if not included_data or not route_id:
-        return {"short_name": "Unknown", "long_name": "Unknown Route"}
-
-    for item in included_data:
-        if item.get('type') == 'route' and item.get('id') == route_id:
+def build_route_index(included_data):
+    """Index the included route records by route id"""
+    route_index = {}
+    for item in included_data or []:
+        if item.get('type') == 'route' and item.get('id') is not None:
             attributes = item.get('attributes', {})
-            return {
+            route_index[item.get('id')] = {
                 "short_name": attributes.get('short_name', 'Unknown'),
                 "long_name": attributes.get('long_name', 'Unknown Route'),
                 "route_type": attributes.get('type', 0)
             }
+    return route_index
+
+
+# Route metadata persisted between runs so a cold start already knows the routes;
+# the file maps each provider's base_url to its own route index
+_ROUTE_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'mybus', 'routes.json')
+_ROUTE_CACHE = None
+
+
+def load_route_cache(cache_path=_ROUTE_CACHE_PATH):
+    """Load the cached route indexes, or an empty cache if there is none"""
+    try:
+        with open(cache_path, 'rb') as file:
+            cache = orjson.loads(file.read())
+        return cache if isinstance(cache, dict) else {}
+    except FileNotFoundError:
+        return {}
+    except (OSError, orjson.JSONDecodeError) as e:
+        logging.warning(f"Ignoring unreadable route cache: {e}")
+        return {}
+
+
+def save_route_cache(cache, cache_path=_ROUTE_CACHE_PATH):
+    """Write the route cache to disk atomically"""
+    tmp_path = f"{cache_path}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(tmp_path, 'wb') as file:
+            file.write(orjson.dumps(cache))
+        os.replace(tmp_path, cache_path)
+    except (OSError, orjson.JSONEncodeError) as e:
+        logging.warning(f"Could not write route cache: {e}")
+
+
+def update_route_cache(base_url, route_index):
+    """Merge freshly included routes into the provider's cache and return the combined index"""
+    global _ROUTE_CACHE
+
+    if _ROUTE_CACHE is None:
+        _ROUTE_CACHE = load_route_cache()
+
+    provider_routes = _ROUTE_CACHE.get(base_url)
+    if not isinstance(provider_routes, dict):
+        provider_routes = _ROUTE_CACHE[base_url] = {}
+
+    if any(provider_routes.get(route_id) != info for route_id, info in route_index.items()):
+        provider_routes.update(route_index)
+        save_route_cache(_ROUTE_CACHE)
+
+    return provider_routes
+
+
+def extract_route_info(route_index, route_id):
+    """Look up route information from the route index"""
+    if not route_index or not route_id:
+        return _NO_ROUTE
+    return route_index.get(route_id, _UNKNOWN_ROUTE)
 
-    return {"short_name": "Unknown", "long_name": "Unknown Route", "route_type": 0}
+
+# GTFS route type names, indexed by route type number
+_ROUTE_TYPE_NAMES = ("Light Rail", "Heavy Rail", "Commuter Rail", "Bus", "Ferry")
 
 
 def get_route_type_name(route_type):
     """Convert route type number to readable name"""
-    route_types = {
-        0: "Light Rail",
-        1: "Heavy Rail",
-        2: "Commuter Rail",
-        3: "Bus",
-        4: "Ferry"
-    }
-    return route_types.get(route_type, "Transit")
+    if isinstance(route_type, int) and 0 <= route_type < len(_ROUTE_TYPE_NAMES):
+        return _ROUTE_TYPE_NAMES[route_type]
+    return "Transit"
 
 
+# Everything a poll needs, derived from the config once at startup
+_PollCtx = namedtuple('_PollCtx', 'base_url url headers timeout stop_name max_arrivals')
 
-def get_bus_arrivals():
-    """Get bus arrivals with comprehensive error handling"""
+
+def init_poll_ctx():
+    """Build the URL, headers and settings used for every poll"""
     # Load configuration
     config = load_config()
     if config is None:
         logging.error("Configuration not available")
-        return []
+        return None
 
     # Extract configuration values safely
     provider_config = config.get('transport_provider', {})
@@ -311,7 +429,7 @@ def get_bus_arrivals():
     request_settings = config.get('request_settings', {})
 
     base_url = provider_config.get('base_url')
-    endpoint_template = safe_get_nested_value(provider_config, 'endpoints', 'arrivals')
+    endpoint_template = _get_endpoint(provider_config)
     api_key = provider_config.get('api_key')
     headers = provider_config.get('headers', {})
     stop_id = bus_stop.get('id')
@@ -322,66 +440,89 @@ def get_bus_arrivals():
     # Validate required parameters
     if not all([base_url, endpoint_template, stop_id]):
         logging.error("Missing required configuration parameters")
-        return []
+        return None
 
     # Build URL with include parameter to get route information
     endpoint = endpoint_template.format(stop_id=stop_id)
-    url = f"{base_url}{endpoint}&include=route&page[limit]={max_arrivals}"
+    url = (f"{base_url}{endpoint}&include=route&fields[route]=short_name,long_name,type"
+           f"&page[limit]={max_arrivals}")
 
     # Add API key to headers if available
     if api_key:
         headers = headers.copy()  # Don't modify original headers
         headers['X-API-Key'] = api_key
 
+    return _PollCtx(base_url, url, headers, timeout, stop_name, max_arrivals)
+
+
+@dataclass
+class Arrivals:
+    """Arrivals for one stop, stored column-wise and sorted by arrival time"""
+    stop_name: str = "Unknown Stop"
+    fetched_at: Optional[float] = None  # Epoch seconds; None if the fetch failed
+    short_names: List[str] = field(default_factory=list)
+    long_names: List[str] = field(default_factory=list)
+    route_types: List[str] = field(default_factory=list)
+    arrival_times: List[str] = field(default_factory=list)
+    formatted_times: List[str] = field(default_factory=list)
+    timestamps: List[Optional[float]] = field(default_factory=list)  # Epoch seconds
+    direction_ids: List[Optional[int]] = field(default_factory=list)
+    statuses: List[Optional[str]] = field(default_factory=list)
+
+    def __len__(self):
+        return len(self.arrival_times)
+
+    def minutes_until(self, now_ts):
+        """Minutes to each arrival as of now_ts, or None if its time is unknown"""
+        return [max(0, int((ts - now_ts) / 60)) if ts is not None else None
+                for ts in self.timestamps]
+
+
+def get_bus_arrivals(ctx):
+    """Get bus arrivals with comprehensive error handling"""
+    stop_name = ctx.stop_name
+
     # Make API request
-    data = make_api_request(url, headers, timeout)
+    data = make_api_request(ctx.url, ctx.headers, ctx.timeout)
     if data is None:
         logging.error("Failed to fetch arrival data")
-        return []
+        return Arrivals(stop_name)
 
-    # Process arrivals safely
-    arrivals = []
-    predictions = data.get('data', [])
-    included_data = data.get('included', [])
-
-    for prediction in predictions:
+    # First pass: pull out the fields we need from predictions that have a time
+    raw = []
+    for prediction in data.get('data', []):
         attributes = prediction.get('attributes', {})
-        relationships = prediction.get('relationships', {})
-
-        arrival_time = attributes.get('arrival_time')
-        departure_time = attributes.get('departure_time')
 
         # Use arrival_time if available, otherwise departure_time
-        predicted_time = arrival_time or departure_time
-
-        if predicted_time:
-            # Get route information
-            route_relationship = relationships.get('route', {})
-            route_data = route_relationship.get('data', {})
-            route_id = route_data.get('id') if route_data else None
-
-            route_info = extract_route_info(included_data, route_id)
-
-            # Calculate time to arrival
-            minutes_to_arrival = calculate_time_to_arrival(predicted_time)
-            formatted_time = format_arrival_time(predicted_time)
-
-            arrivals.append({
-                'route_short_name': route_info['short_name'],
-                'route_long_name': route_info['long_name'],
-                'route_type': get_route_type_name(route_info.get('route_type', 3)),
-                'arrival_time': predicted_time,
-                'formatted_time': formatted_time,
-                'minutes_to_arrival': minutes_to_arrival,
-                'direction_id': attributes.get('direction_id'),
-                'status': attributes.get('status'),
-                'stop_name': stop_name
-            })
+        predicted_time = attributes.get('arrival_time') or attributes.get('departure_time')
+        if not predicted_time:
+            continue
 
-    # Sort by arrival time
-    arrivals.sort(key=lambda x: x['arrival_time'] if x['arrival_time'] else '')
+        route_data = prediction.get('relationships', {}).get('route', {}).get('data')
+        route_id = route_data.get('id') if route_data else None
+        raw.append((predicted_time, route_id, attributes.get('direction_id'), attributes.get('status')))
 
-    return arrivals
+    # Sort by arrival time
+    raw.sort(key=_ARRIVAL_KEY)
+
+    # Second pass: compute each column in bulk
+    route_index = update_route_cache(ctx.base_url, build_route_index(data.get('included', [])))
+    dts = [parse_arrival_time(t) for t, _, _, _ in raw]
+    routes = [extract_route_info(route_index, route_id) for _, route_id, _, _ in raw]
+
+    return Arrivals(
+        stop_name=stop_name,
+        fetched_at=time.time(),
+        short_names=[r['short_name'] for r in routes],
+        long_names=[r['long_name'] for r in routes],
+        route_types=[get_route_type_name(r.get('route_type', 3)) for r in routes],
+        arrival_times=[t for t, _, _, _ in raw],
+        formatted_times=[d.astimezone(_EASTERN).strftime('%I:%M %p') if d else t
+                         for d, (t, _, _, _) in zip(dts, raw)],
+        timestamps=[d.timestamp() if d else None for d in dts],
+        direction_ids=[direction_id for _, _, direction_id, _ in raw],
+        statuses=[status for _, _, _, status in raw],
+    )
 
 
 def display_arrivals(arrivals):
@@ -395,29 +536,64 @@ def display_arrivals(arrivals):
     return bus_display.display_arrivals(arrivals)
 
 
-def run_monitoring():
+def _drain(q):
+    """Discard any snapshot the display has not picked up yet"""
+    try:
+        while True:
+            q.get_nowait()
+    except queue.Empty:
+        pass
+
+
+def fetch_loop(q, ctx, stop):
+    """Poll the API in the background and publish the latest arrivals"""
+    next_fetch = time.monotonic()
+    while not stop.is_set():
+        try:
+            arrivals = get_bus_arrivals(ctx)
+        except Exception:
+            # Keep polling; the display shows when data was last fetched
+            logging.exception("Unexpected error while fetching arrivals")
+        else:
+            _drain(q)
+            q.put(arrivals)
+
+        # Gate on a monotonic deadline so slow requests don't stretch the cadence
+        next_fetch = max(next_fetch + FETCH_INTERVAL, time.monotonic())
+        stop.wait(next_fetch - time.monotonic())
+
+
+def run_monitoring(ctx):
     global bus_display
 
-    q = Queue()
+    fetch_q = queue.Queue(maxsize=1)
     print("🚀 Starting transit arrival monitoring...")
     print("❸️  Press ESC in the display window to stop")
     print()
 
+    # Network I/O runs on a daemon thread so the display never blocks on it;
+    # frame pacing comes from clock.tick(60) inside display_arrivals
+    stop = threading.Event()
+    fetcher = threading.Thread(target=fetch_loop, args=(fetch_q, ctx, stop), daemon=True)
+    fetcher.start()
+
+    latest = Arrivals(ctx.stop_name)
     try:
         while True:
-            # Fetch arrivals
-            arrivals = get_bus_arrivals()
+            # Pick up the newest arrivals if the fetcher has published any
+            try:
+                latest = fetch_q.get_nowait()
+            except queue.Empty:
+                pass
 
             # Display using pygame - returns False if user wants to quit
-            if not display_arrivals(arrivals):
+            if not display_arrivals(latest):
                 break
 
-            # Small delay to prevent excessive CPU usage
-            time.sleep(1)
-
     except KeyboardInterrupt:
         print("Monitoring stopped by user")
     finally:
+        stop.set()
         if bus_display:
             bus_display.cleanup()
 
@@ -425,7 +601,11 @@ def run_monitoring():
 def main():
     """Main function with error handling"""
     try:
-        run_monitoring()
+        ctx = init_poll_ctx()
+        if ctx is None:
+            print("❌ Check ProviderConfig.json - the configuration could not be used")
+            return
+        run_monitoring(ctx)
     except Exception as e:
         logging.error(f"Unexpected error: {e}")
         print("❌ An error occurred while running the monitoring system")
@@ -433,6 +613,7 @@ def main():
         # Ensure pygame is properly cleaned up
         if 'bus_display' in globals() and bus_display:
             bus_display.cleanup()
+        _SESSION.close()
 
 
 if __name__ == "__main__":